@@ -15,12 +15,14 @@ for license details.
 
 # %%
 
-import sys
 import numpy as np
 import pandas as pd
 from math import ceil
+from functools import lru_cache
+from itertools import chain
 from collections.abc import Iterable
 from warnings import warn
+from numba import njit
 from . import ImpactIndicator, ImpactItem, Stream, SanStream, SanUnit
 from .utils import (
     auom,
@@ -30,6 +32,24 @@ from .utils import (
 __all__ = ('LCA',)
 
 
+@lru_cache(maxsize=128)
+def _get_conversion_factor(unit, new_unit):
+    '''Return the (cached) factor to convert a quantity from `unit` to `new_unit`.'''
+    return auom(unit).convert(1., new_unit)
+
+@njit(cache=True)
+def _add_stream_CF_impacts(indptr, indices, CFs, F_mass, excluded, time, vals):
+    # Nonzero CFs of stream `s` are CFs[indptr[s]:indptr[s+1]],
+    # located at indicator positions indices[indptr[s]:indptr[s+1]],
+    # zero CFs are dropped once when caching, zero flows are skipped here
+    for s in range(F_mass.shape[0]):
+        if excluded[s] or F_mass[s] == 0.:
+            continue
+        factor = time * F_mass[s]
+        for p in range(indptr[s], indptr[s+1]):
+            vals[indices[p]] += factor * CFs[p]
+
+
 class LCA:
     '''
     For life cycle assessment (LCA) of a System.
@@ -200,6 +220,130 @@ class LCA:
     >>> lca.get_total_impacts(exclude=sys.products)['GlobalWarming'] # doctest: +ELLIPSIS
     5469807.9765...
 
+    Or provide the ratios directly, either as an Iterable or a function
+    that returns an Iterable (the given ratios will not be changed)
+
+    >>> import numpy as np
+    >>> products = sorted(sys.products, key=lambda s: s.ID)
+    >>> [s.ID for s in products]
+    ['alcohols', 'waste_brine']
+    >>> allocated = lca.get_allocated_impacts(products, allocate_by=[1, 3])
+    >>> round(allocated['waste_brine']['GlobalWarming']/allocated['alcohols']['GlobalWarming'], 2)
+    3.0
+    >>> ratios = np.array([1., 3.])
+    >>> allocated = lca.get_allocated_impacts(products, allocate_by=lambda: ratios)
+    >>> round(allocated['waste_brine']['GlobalWarming']/allocated['alcohols']['GlobalWarming'], 2)
+    3.0
+    >>> ratios
+    array([1., 3.])
+    >>> lca.get_allocated_impacts(products, allocate_by='volume')
+    Traceback (most recent call last):
+    ...
+    ValueError: allocate_by can only be "mass", "energy", "value", an Iterable (with the same length as `streams`), or a function to generate an Iterable.
+
+    Characterization factors of the stream inventory are cached,
+    so if they are changed after the LCA is created, the inventory needs to be updated
+
+    >>> old = lca.get_stream_impacts()['GlobalWarming']
+    >>> brine_item.add_indicator(GWP, 4)
+    >>> lca.update_inventory()
+    >>> new = lca.get_stream_impacts()['GlobalWarming']
+    >>> bool(np.isclose(new-old, 2*waste_brine.F_mass*lca.lifetime_hr))
+    True
+    >>> brine_item.add_indicator(GWP, 2)
+    >>> lca.update_inventory()
+
+    Zero characterization factors are dropped when the CFs are cached,
+    so this also applies to a CF changed from zero to nonzero
+
+    >>> alcohols_item.add_indicator(GWP, 0)
+    >>> lca.update_inventory()
+    >>> before = lca.get_stream_impacts()['GlobalWarming']
+    >>> alcohols_item.add_indicator(GWP, -0.2)
+    >>> lca.update_inventory()
+    >>> after = lca.get_stream_impacts()['GlobalWarming']
+    >>> bool(np.isclose(before-after, 0.2*alcohols.F_mass*lca.lifetime_hr))
+    True
+
+    The same goes for the default indicators when new indicators are added
+    to the impact items
+
+    >>> AP = qs.ImpactIndicator('Acidification', unit='kg SO2-eq')
+    >>> 'Acidification' in lca.get_total_impacts()
+    False
+    >>> brine_item.add_indicator(AP, 0.1)
+    >>> lca.update_inventory()
+    >>> bool(np.isclose(lca.get_total_impacts()['Acidification'],
+    ...                 0.1*waste_brine.F_mass*lca.lifetime_hr))
+    True
+
+    The total impacts are consistent with the sum of all categories
+    for any given time frame, note that when `time=0`, construction activities
+    with a lifetime have no impacts (other categories will use the LCA lifetime)
+
+    >>> SS_constr_M1.lifetime = 5
+    >>> def sum_categories(**kwargs):
+    ...     cats = (lca.get_construction_impacts(**kwargs),
+    ...             lca.get_transportation_impacts(**kwargs),
+    ...             lca.get_stream_impacts(**kwargs),
+    ...             lca.get_other_impacts(**kwargs))
+    ...     return sum(cat['GlobalWarming'] for cat in cats)
+    >>> for kwargs in ({}, {'time': 0}, {'time': 3, 'time_unit': 'd'}):
+    ...     tot = lca.get_total_impacts(**kwargs)['GlobalWarming']
+    ...     assert np.isclose(tot, sum_categories(**kwargs)), kwargs
+    >>> lca.get_construction_impacts(time=0)['GlobalWarming'] # only concrete
+    200.0
+    >>> SS_constr_M1.lifetime = 10
+
+    If activities are added to (or removed from) units or streams after
+    the LCA has been created, the inventory can be updated without
+    re-scanning the entire system
+
+    >>> P1 = flowsheet.unit.P1
+    >>> old = lca.get_construction_impacts()['GlobalWarming']
+    >>> P1.construction = qs.Construction(item=SS, quantity=10)
+    >>> lca.update_inventory(units=P1)
+    >>> lca.construction_units
+    (<MixTank: M1>, <Pump: P1>)
+    >>> lca.get_construction_impacts()['GlobalWarming'] - old
+    30.0
+    >>> P1.construction = ()
+    >>> lca.update_inventory(units=P1)
+    >>> lca.construction_units
+    (<MixTank: M1>,)
+
+    Below is for testing purpose, you do not need it.
+    Impacts of the whole stream inventory are calculated in a vectorized manner,
+    which should give the same results as going through each stream item
+
+    >>> def check_stream_impacts():
+    ...     for kind in ('all', 'direct_emission', 'offset'):
+    ...         for exclude in (None, sys.products):
+    ...             fast = lca.get_stream_impacts(kind=kind, exclude=exclude)
+    ...             slow = lca.get_stream_impacts(stream_items=lca.stream_inventory,
+    ...                                           kind=kind, exclude=exclude)
+    ...             assert fast.keys() == slow.keys()
+    ...             assert np.allclose([fast[k] for k in fast], [slow[k] for k in fast]), (kind, exclude)
+    >>> check_stream_impacts()
+    >>> # Streams without flows
+    >>> ethanol_mol = ethanol.mol.copy()
+    >>> ethanol.empty()
+    >>> check_stream_impacts()
+    >>> ethanol.mol[:] = ethanol_mol
+    >>> # Empty stream inventory
+    >>> stream_items = {ws: ws.stream_impact_item for ws in lca.lca_streams}
+    >>> for ws in stream_items: ws.stream_impact_item = None
+    >>> lca.update_inventory(streams=stream_items)
+    >>> lca.lca_streams
+    ()
+    >>> check_stream_impacts()
+    >>> set(lca.get_stream_impacts().values())
+    {0.0}
+    >>> for ws, item in stream_items.items(): ws.stream_impact_item = item
+    >>> lca.update_inventory(streams=stream_items)
+    >>> len(lca.lca_streams)
+    4
+
     See Also
     --------
     `SanUnit and System <https://qsdsan.readthedocs.io/en/latest/tutorials/SanUnit_and_System.html>`_
@@ -209,7 +353,7 @@ class LCA:
 
     __slots__ = ('_system',  '_lifetime', '_uptime_ratio',
                  '_construction_units', '_transportation_units',
-                 '_lca_streams', '_indicators',
+                 '_lca_streams', '_indicators', '_cache',
                  '_other_items', '_other_items_f', 'annualize_construction')
 
 
@@ -217,9 +361,7 @@ class LCA:
                  indicators=(), uptime_ratio=1, annualize_construction=False,
                  **item_quantities):
         system.simulate()
-        self._construction_units = set()
-        self._transportation_units = set()
-        self._lca_streams = set()
+        self._cache = {}
         self._update_system(system)
         self._update_lifetime(lifetime, lifetime_unit)
         self.indicators = indicators
@@ -228,47 +370,85 @@ class LCA:
         self._other_items = {}
         self._other_items_f = {}
         for item, val in item_quantities.items():
-            try:
-                f_quantity, unit = val # unit provided for the quantity
-            except Exception as e:
-                if 'unpack' in str(sys.exc_info()[1]):
-                    f_quantity = val
-                    unit = ''
-                else:
-                    raise e
-            self.add_other_item(item, f_quantity, unit)
+            if isinstance(val, (tuple, list)) and len(val) == 2: # unit provided for the quantity
+                self.add_other_item(item, *val)
+            else:
+                self.add_other_item(item, val)
 
 
     def _update_system(self, system):
+        constr_units, trans_units, lca_streams = set(), set(), set()
         for u in system.units:
             if not isinstance (u, SanUnit):
                 continue
             if u.construction:
-                self._construction_units.add(u)
+                constr_units.add(u)
             if u.transportation:
-                self._transportation_units.add(u)
-        self._construction_units = sorted(self._construction_units,
-                                          key=lambda u: u.ID)
-        self._transportation_units = sorted(self._transportation_units,
-                                            key=lambda u: u.ID)
+                trans_units.add(u)
         for s in (i for i in system.feeds+system.products):
             if not hasattr(s, 'stream_impact_item'):
                 continue
             if s.stream_impact_item:
-                self._lca_streams.add(s)
-        self._lca_streams = sorted(self._lca_streams, key=lambda s: s.ID)
+                lca_streams.add(s)
+        # Only iterated over after this point, so store as sorted tuples
+        self._construction_units = tuple(sorted(constr_units, key=lambda u: u.ID))
+        self._transportation_units = tuple(sorted(trans_units, key=lambda u: u.ID))
+        self._lca_streams = tuple(sorted(lca_streams, key=lambda s: s.ID))
         self._system = system
+        self._cache.clear()
         try: # for older versions of biosteam without the `_LCA` attribute
             system._LCA = self
         except AttributeError:
             pass
 
 
+    def update_inventory(self, units=(), streams=()):
+        '''
+        Add/remove the given units and streams to/from the inventory based on
+        their current construction/transportation activities and stream impact items,
+        without re-scanning the entire system
+        (setting `LCA.system` will rebuild the inventory from scratch).
+
+        Calling it without any arguments keeps the units and streams but
+        clears the cached indicators and characterization factors,
+        e.g., after `ImpactItem.add_indicator`.
+
+        Parameters
+        ----------
+        units : obj or iterable
+            :class:`SanUnit` (or an iterable of them) whose construction and/or
+            transportation activities have been added or removed.
+        streams : obj or iterable
+            :class:`SanStream` (or an iterable of them) whose
+            `stream_impact_item` has been added or removed.
+        '''
+        isa = isinstance
+        units = (units,) if not isa(units, Iterable) else units
+        streams = (streams,) if not isa(streams, Iterable) else streams
+        constr_units = set(self._construction_units)
+        trans_units = set(self._transportation_units)
+        lca_streams = set(self._lca_streams)
+        for u in units:
+            if not isa(u, SanUnit):
+                continue
+            if u.construction: constr_units.add(u)
+            else: constr_units.discard(u)
+            if u.transportation: trans_units.add(u)
+            else: trans_units.discard(u)
+        for s in streams:
+            if getattr(s, 'stream_impact_item', None): lca_streams.add(s)
+            else: lca_streams.discard(s)
+        self._construction_units = tuple(sorted(constr_units, key=lambda u: u.ID))
+        self._transportation_units = tuple(sorted(trans_units, key=lambda u: u.ID))
+        self._lca_streams = tuple(sorted(lca_streams, key=lambda s: s.ID))
+        self._cache.clear()
+
+
     def _update_lifetime(self, lifetime=0., unit='yr'):
         if not unit or unit == 'yr':
             self._lifetime = int(lifetime)
         else:
-            converted = auom(unit).convert(int(lifetime), 'yr')
+            converted = int(lifetime) * _get_conversion_factor(unit, 'yr')
             self._lifetime = converted
 
 
@@ -284,19 +464,20 @@ class LCA:
         quantity = f()
         if unit and unit != fu:
             try:
-                quantity = auom(unit).convert(quantity, fu)
+                quantity *= _get_conversion_factor(unit, fu)
             except:
                 raise ValueError(f'Conversion of the given unit {unit} to '
                                  f'item functional unit {fu} is not supported.')
         self._other_items_f[item.ID] = {'item':item, 'f_quantity':f, 'unit':unit}
-        self.other_items[item.ID] = {'item':item, 'quantity':quantity}
+        self._other_items[item.ID] = {'item':item, 'quantity':quantity}
+        self._cache.clear()
 
 
     def refresh_other_items(self):
         '''Refresh quantities of other items using the given functions.'''
         for item_ID, record in self._other_items_f.items():
             item, f_quantity, unit = record.values()
-            self.other_items[item_ID]['quantity'] = f_quantity()
+            self._other_items[item_ID]['quantity'] = f_quantity()
 
 
     def __repr__(self):
@@ -311,98 +492,79 @@ class LCA:
         if len(self.indicators) == 0:
             print(' None')
         else:
-            index = pd.Index((i.ID+' ('+i.unit+')' for i in self.indicators))
-            df = pd.DataFrame({
-                'Construction': tuple(self.total_construction_impacts.values()),
-                'Transportation': tuple(self.total_transportation_impacts.values()),
-                'Stream': tuple(self.total_stream_impacts.values()),
-                'Others': tuple(self.total_other_impacts.values()),
-                'Total': tuple(self.total_impacts.values())
-                },
-                index=index)
+            inds = self.indicators
+            index = pd.Index((i.ID+' ('+i.unit+')' for i in inds))
+            impacts = self._get_category_impacts()
+            df = pd.DataFrame({cat: [dct[i.ID] for i in inds] for cat, dct in impacts.items()},
+                              index=index)
             # print(' '*9+df.to_string().replace('\n', '\n'+' '*9))
             print(df.to_string())
 
     _ipython_display_ = show
 
 
-    def get_construction_impacts(self, units=None, time=None, time_unit='hr'):
-        '''
-        Return all construction-related impacts for the given unit,
-        normalized to a certain time frame.
-        '''
-        units = self.construction_units if units is None else units
+    def _add_construction_impacts(self, vals, idx, units, time):
         annualize = self.annualize_construction
-        if not isinstance(units, Iterable) or isinstance(units, str):
-            units = (units,)
-        if time is None:
-            time = self.lifetime_hr
-        else:
-            time = auom(time_unit).convert(float(time), 'hr')
-        impacts = dict.fromkeys((i.ID for i in self.indicators), 0.)
         for i in units:
             if not isinstance(i, SanUnit):
                 continue
             for j in i.construction:
                 impact = j.impacts
                 if j.lifetime is not None: # this equipment has a lifetime
-                    constr_lifetime = auom('yr').convert(j.lifetime, 'hr')
+                    constr_lifetime = j.lifetime * _get_conversion_factor('yr', 'hr')
                     ratio = ceil(time/constr_lifetime) if not annualize else time/constr_lifetime
                 else: # equipment doesn't have a lifetime
                     if i.lifetime and not isinstance(i.lifetime, dict): # unit has a uniform lifetime
-                        constr_lifetime = auom('yr').convert(i.lifetime, 'hr')
+                        constr_lifetime = i.lifetime * _get_conversion_factor('yr', 'hr')
                         ratio = ceil(time/constr_lifetime) if not annualize else time/constr_lifetime
                     else: # no lifetime, assume just need one
                         ratio = 1.
                 for m, n in impact.items():
-                    if m not in impacts.keys():
+                    k = idx.get(m)
+                    if k is None:
                         continue
-                    impacts[m] += n*ratio
-        return impacts
+                    vals[k] += n*ratio
 
-    def get_transportation_impacts(self, units=None, time=None, time_unit='hr'):
-        '''
-        Return all transportation-related impacts for the given unit,
-        normalized to a certain time frame.
-        '''
-        units = self.transportation_units if units is None else units
-        if not isinstance(units, Iterable):
-            units = (units,)
-        if not time:
-            time = self.lifetime_hr
-        else:
-            time = auom(time_unit).convert(float(time), 'hr')
-        impacts = dict.fromkeys((i.ID for i in self.indicators), 0.)
+    def _add_transportation_impacts(self, vals, idx, units, time):
         for i in units:
             if not isinstance(i, SanUnit):
                 continue
             for j in i.transportation:
                 impact = j.impacts
+                factor = time / j.interval
                 for m, n in impact.items():
-                    if m not in impacts.keys():
+                    k = idx.get(m)
+                    if k is None:
                         continue
-                    impacts[m] += n*time/j.interval
-        return impacts
+                    vals[k] += n*factor
 
-
-    def get_stream_impacts(self, stream_items=None, exclude=None,
-                           kind='all', time=None, time_unit='hr'):
-        '''
-        Return all stream-related impacts for the given streams,
-        normalized to a certain time frame.
-        '''
+    def _add_stream_impacts(self, vals, idx, stream_items, exclude, kind, time):
         isa = isinstance
-        if stream_items == None:
-            stream_items = self.stream_inventory
-        if not isa(stream_items, Iterable):
-            stream_items = (stream_items,)
         if not isa(exclude, Iterable):
             exclude = (exclude,)
-        impacts = dict.fromkeys((i.ID for i in self.indicators), 0.)
-        if not time:
-            time = self.lifetime_hr
-        else:
-            time = auom(time_unit).convert(float(time), 'hr')
+        if kind not in ('all', 'total', 'net', 'direct', 'direct_emission', 'offset'):
+            raise ValueError('kind can only be "all", "direct_emission", or "offset", '
+                             f'not "{kind}".')
+
+        if stream_items is None: # all streams in the inventory, use the sparse CFs
+            indptr, indices, CFs = self._get_stream_CFs(idx)
+            if not CFs.size: # no stream impacts, nothing to add
+                return
+            if kind in ('direct', 'direct_emission'):
+                CFs = CFs.clip(min=0)
+            elif kind == 'offset':
+                CFs = CFs.clip(max=0)
+            streams = self._lca_streams
+            F_mass = np.fromiter((ws.F_mass for ws in streams),
+                                 dtype=float, count=len(streams))
+            excluded = np.fromiter((ws in exclude for ws in streams),
+                                   dtype=bool, count=len(streams))
+            out = np.zeros(len(vals))
+            _add_stream_CF_impacts(indptr, indices, CFs, F_mass, excluded, time, out)
+            for k, n in enumerate(out.tolist()):
+                vals[k] += n
+            return
+
         for j in stream_items:
             # In case that ws instead of the item is given
             if isa(j, Stream):
@@ -415,22 +577,107 @@ class LCA:
             else:
                 ws = j.linked_stream
 
-            if ws in exclude: continue
+            if ws in exclude or not ws.F_mass: continue
 
+            factor = time * ws.F_mass
             for m, n in j.CFs.items():
-                if kind in ('all', 'total', 'net'):
-                    pass
-                elif kind in ('direct', 'direct_emission'):
+                if kind in ('direct', 'direct_emission'):
                     n = max(n, 0)
                 elif kind == 'offset':
                     n = min(n, 0)
-                else:
-                    raise ValueError('kind can only be "all", "direct_emission", or "offset", '
-                                     f'not "{kind}".')
-                if m not in impacts.keys():
+                k = idx.get(m)
+                if k is None or not n:
+                    continue
+                vals[k] += n*factor
+
+    def _get_stream_CFs(self, idx):
+        '''
+        Return the nonzero characterization factors of the stream inventory
+        in compressed sparse row (CSR) form as (indptr, indices, CFs),
+        rows are aligned with `lca_streams` and indices refer to the indicators.
+        Cached until the inventory is updated, so CFs changed after the LCA is created
+        (e.g., through `ImpactItem.add_indicator`) need :func:`update_inventory`.
+        '''
+        matrix = self._cache.get('stream_CFs')
+        if matrix is None:
+            indptr, indices, CFs = [0], [], []
+            for ws in self._lca_streams:
+                for m, n in ws.stream_impact_item.CFs.items():
+                    k = idx.get(m)
+                    if k is None or not n:
+                        continue
+                    indices.append(k)
+                    CFs.append(n)
+                indptr.append(len(CFs))
+            matrix = self._cache['stream_CFs'] = (
+                np.array(indptr, dtype=np.int64),
+                np.array(indices, dtype=np.int64),
+                np.array(CFs, dtype=float),
+                )
+        return matrix
+
+    def _add_other_impacts(self, vals, idx, time):
+        factor = time / self.lifetime_hr
+        for record in self._other_items.values():
+            item = record['item']
+            quantity = record['quantity'] * factor
+            for m, n in item.CFs.items():
+                k = idx.get(m)
+                if k is None:
                     continue
-                impacts[m] += n*time*ws.F_mass
-        return impacts
+                vals[k] += n*quantity
+
+    def get_construction_impacts(self, units=None, time=None, time_unit='hr'):
+        '''
+        Return all construction-related impacts for the given unit,
+        normalized to a certain time frame.
+        '''
+        units = self._construction_units if units is None else units
+        if not isinstance(units, Iterable) or isinstance(units, str):
+            units = (units,)
+        if time is None:
+            time = self.lifetime_hr
+        else:
+            time = float(time) * _get_conversion_factor(time_unit, 'hr')
+        IDs, idx = self._get_indicator_index()
+        vals = [0.]*len(IDs)
+        self._add_construction_impacts(vals, idx, units, time)
+        return dict(zip(IDs, vals))
+
+    def get_transportation_impacts(self, units=None, time=None, time_unit='hr'):
+        '''
+        Return all transportation-related impacts for the given unit,
+        normalized to a certain time frame.
+        '''
+        units = self._transportation_units if units is None else units
+        if not isinstance(units, Iterable):
+            units = (units,)
+        if not time:
+            time = self.lifetime_hr
+        else:
+            time = float(time) * _get_conversion_factor(time_unit, 'hr')
+        IDs, idx = self._get_indicator_index()
+        vals = [0.]*len(IDs)
+        self._add_transportation_impacts(vals, idx, units, time)
+        return dict(zip(IDs, vals))
+
+
+    def get_stream_impacts(self, stream_items=None, exclude=None,
+                           kind='all', time=None, time_unit='hr'):
+        '''
+        Return all stream-related impacts for the given streams,
+        normalized to a certain time frame.
+        '''
+        if stream_items is not None and not isinstance(stream_items, Iterable):
+            stream_items = (stream_items,)
+        IDs, idx = self._get_indicator_index()
+        vals = [0.]*len(IDs)
+        if not time:
+            time = self.lifetime_hr
+        else:
+            time = float(time) * _get_conversion_factor(time_unit, 'hr')
+        self._add_stream_impacts(vals, idx, stream_items, exclude, kind, time)
+        return dict(zip(IDs, vals))
 
     def get_other_impacts(self, time=None, time_unit='hr'):
         '''
@@ -438,36 +685,47 @@ class LCA:
         based on defined quantity.
         '''
         self.refresh_other_items()
-        impacts = dict.fromkeys((i.ID for i in self.indicators), 0.)
-        other_dct = self.other_items
+        IDs, idx = self._get_indicator_index()
+        vals = [0.]*len(IDs)
         if not time:
             time = self.lifetime_hr
         else:
-            time = auom(time_unit).convert(float(time), 'hr')
-        factor = time / self.lifetime_hr
-        for i in other_dct.keys():
-            item = ImpactItem.get_item(i)
-            for m, n in item.CFs.items():
-                if m not in impacts.keys():
-                    continue
-                impacts[m] += n*other_dct[i]['quantity']*factor
-        return impacts
+            time = float(time) * _get_conversion_factor(time_unit, 'hr')
+        self._add_other_impacts(vals, idx, time)
+        return dict(zip(IDs, vals))
 
     def get_total_impacts(self, exclude=None, time=None, time_unit='hr'):
         '''Return total impacts, normalized to a certain time frame.'''
-        impacts = dict.fromkeys((i.ID for i in self.indicators), 0.)
-        constr = self.get_construction_impacts(self.construction_units, time=time, time_unit=time_unit)
-        trans = self.get_transportation_impacts(self.transportation_units, time=time, time_unit=time_unit)
-        ws_impacts = self.get_stream_impacts(stream_items=self.stream_inventory,
-                                             exclude=exclude, time=time, time_unit=time_unit)
-        other = self.get_other_impacts(time=time, time_unit=time_unit)
-
-        for i in (constr, trans, ws_impacts, other):
-            for m, n in i.items():
-                if m not in impacts.keys():
-                    continue
-                impacts[m] += n
-        return impacts
+        return self._get_category_impacts(exclude, time, time_unit)['Total']
+
+    def _get_category_impacts(self, exclude=None, time=None, time_unit='hr'):
+        '''
+        Return impacts of each category (construction, transportation, stream, and others)
+        and their total, accumulated in a single sweep.
+        '''
+        self.refresh_other_items()
+        # Construction only falls back to the lifetime when `time` is None
+        # (i.e., `time=0` gives no construction impacts), consistent with
+        # `get_construction_impacts`, while the others also do for `time=0`
+        if time is None:
+            constr_time = time = self.lifetime_hr
+        else:
+            constr_time = float(time) * _get_conversion_factor(time_unit, 'hr')
+            time = constr_time or self.lifetime_hr
+        IDs, idx = self._get_indicator_index()
+        constr, trans, stream, other = ([0.]*len(IDs) for i in range(4))
+        self._add_construction_impacts(constr, idx, self._construction_units, constr_time)
+        self._add_transportation_impacts(trans, idx, self._transportation_units, time)
+        self._add_stream_impacts(stream, idx, None, exclude, 'all', time)
+        self._add_other_impacts(other, idx, time)
+        get = lambda vals: dict(zip(IDs, vals))
+        return {
+            'Construction': get(constr),
+            'Transportation': get(trans),
+            'Stream': get(stream),
+            'Others': get(other),
+            'Total': get([sum(i) for i in zip(constr, trans, stream, other)]),
+            }
 
     def get_allocated_impacts(self, streams=(), allocate_by='mass'):
         '''
@@ -499,29 +757,31 @@ class LCA:
         if not isinstance(streams, Iterable):
             streams = (streams,)
         impact_dct = self.get_total_impacts(exclude=streams)
-        impact_vals = np.array([i for i in impact_dct.values()])
+        impact_vals = np.fromiter(impact_dct.values(), dtype=float, count=len(impact_dct))
         allocated = {}
         if len(streams) == 1:
             if not isinstance(streams[0], SanStream):
                 return None
             return impact_dct
-        if allocate_by == 'mass':
-            ratios = np.array([i.F_mass for i in streams])
+        if callable(allocate_by):
+            ratios = allocate_by()
+        elif isinstance(allocate_by, Iterable) and not isinstance(allocate_by, str):
+            ratios = allocate_by
+        elif allocate_by == 'mass':
+            ratios = [i.F_mass for i in streams]
         elif allocate_by == 'energy':
-            ratios = np.array([i.HHV for i in streams])
+            ratios = [i.HHV for i in streams]
         elif allocate_by == 'value':
-            ratios = np.array([i.F_mass*i.price for i in streams])
-        elif iter(allocate_by):
-            ratios = allocate_by
-        elif callable(allocate_by):
-            ratios = allocate_by()
+            ratios = [i.F_mass*i.price for i in streams]
         else:
             raise ValueError('allocate_by can only be "mass", "energy", "value", '
                              'an Iterable (with the same length as `streams`), '
                              'or a function to generate an Iterable.')
-        if ratios.sum() == 0:
+        ratios = np.asarray(ratios, dtype=float)
+        ratio_sum = ratios.sum()
+        if ratio_sum == 0:
             raise ValueError('Calculated allocation ratios are all zero, cannot allocate.')
-        ratios = ratios/ratios.sum()
+        ratios = ratios / ratio_sum
         for n, s in enumerate(streams):
             if not isinstance(s, SanStream):
                 continue
@@ -539,7 +799,7 @@ class LCA:
         constr = self.get_construction_impacts(units, time, time_unit)
         trans = self.get_transportation_impacts(units, time, time_unit)
         stream_items = set(i for i in
-                       sum((tuple(unit.ins+unit.outs) for unit in units), ())
+                       chain.from_iterable(unit.ins+unit.outs for unit in units)
                        if i.impact_item)
 
         s = self.get_stream_impacts(stream_items=stream_items, exclude=exclude,
@@ -576,7 +836,7 @@ class LCA:
         if not time:
             time = self.lifetime_hr
         else:
-            time = auom(time_unit).convert(float(time), 'hr')
+            time = float(time) * _get_conversion_factor(time_unit, 'hr')
 
         cat = category.lower()
         tot_f = getattr(self, f'get_{cat}_impacts')
@@ -663,10 +923,10 @@ class LCA:
             item_dct = dict.fromkeys(headings)
             for key in item_dct.keys():
                 item_dct[key] = []
-            for other_ID in self.other_items.keys():
-                other = self.other_items[other_ID]['item']
+            for other_ID in self._other_items.keys():
+                other = self._other_items[other_ID]['item']
                 item_dct['Other'].append(f'{other_ID} [{other.functional_unit}]')
-                quantity = self.other_items[other_ID]['quantity'] * time_ratio
+                quantity = self._other_items[other_ID]['quantity'] * time_ratio
                 item_dct['Quantity'].append(quantity)
                 for ind in self.indicators:
                     if ind.ID in other.CFs.keys():
@@ -741,34 +1001,29 @@ class LCA:
         sum of the `ImpactIndicator` objects added to the system associated
         with this LCA (e.g., associated with construction, streams, etc.
 
+        The default is cached until the inventory is updated, so if indicators
+        are added to the impact items after the LCA is created
+        (e.g., through `ImpactItem.add_indicator`), or if units/streams gain or
+        lose activities, call :func:`update_inventory` (or reset the `system`).
         '''
         if self._indicators:
             return self._indicators
 
-        if not self.construction_inventory:
-            constr = set()
-        else:
-            constr = set(sum((i.indicators for i in self.construction_inventory
-                              if i is not None), ()))
-        if not self.transportation_inventory:
-            trans = set()
-        else:
-            trans = set(sum((i.indicators for i in self.transportation_inventory
-                             if i is not None), ()))
-        if not self.stream_inventory:
-            ws = set()
-        else:
-            ws = set(sum((i.indicators for i in self.stream_inventory
-                          if i is not None), ()))
-        if not self.other_items:
-            other = set()
-        else:
-            other = set(sum((ImpactItem.get_item(i).indicators
-                             for i in self.other_items.keys()), ()))
-        tot = constr.union(trans, ws, other)
-        if len(tot) == 0:
-            warn('No `ImpactIndicator` has been added.')
-        return list(tot)
+        inds = self._cache.get('indicators')
+        if inds is None:
+            constr = set(chain.from_iterable(i.indicators for i in self.construction_inventory
+                                             if i is not None))
+            trans = set(chain.from_iterable(i.indicators for i in self.transportation_inventory
+                                            if i is not None))
+            ws = set(chain.from_iterable(i.indicators for i in self.stream_inventory
+                                         if i is not None))
+            other = set(chain.from_iterable(record['item'].indicators
+                                            for record in self._other_items.values()))
+            tot = constr.union(trans, ws, other)
+            if len(tot) == 0:
+                warn('No `ImpactIndicator` has been added.')
+            inds = self._cache['indicators'] = tuple(tot)
+        return list(inds)
     @indicators.setter
     def indicators(self, i):
         if not (isinstance(i, Iterable) and not isinstance(i, str)):
@@ -781,51 +1036,64 @@ class LCA:
                 raise TypeError(f'{ind} is not an `ImpactIndicator` or ID/alias of an `ImpactIndicator`.')
             inds.append(ind)
         self._indicators = inds
+        self._cache.clear()
+
+    def _get_indicator_index(self):
+        '''
+        Return the IDs of the indicators and a dict of their positions,
+        cached until the inventory or the indicators are updated.
+        '''
+        cached = self._cache.get('indicator_index')
+        if cached is None:
+            IDs = tuple(i.ID for i in self.indicators)
+            cached = self._cache['indicator_index'] = \
+                (IDs, {ID: n for n, ID in enumerate(IDs)})
+        return cached
 
     @property
     def construction_units(self):
-        '''[set] All units in the linked system with construction activity.'''
+        '''[tuple] All units in the linked system with construction activity.'''
         return self._construction_units
 
     @property
     def construction_inventory(self):
         '''[tuple] All construction activities.'''
-        return sum((i.construction for i in self.construction_units), ())
+        return tuple(chain.from_iterable(i.construction for i in self._construction_units))
 
     @property
     def total_construction_impacts(self):
         '''[dict] Total impacts associated with construction activities.'''
-        return self.get_construction_impacts(self.construction_units)
+        return self.get_construction_impacts(self._construction_units)
 
     @property
     def transportation_units(self):
-        '''[set] All units in the linked system with transportation activity.'''
+        '''[tuple] All units in the linked system with transportation activity.'''
         return self._transportation_units
 
     @property
     def transportation_inventory(self):
         '''[tuple] All transportation activities.'''
-        return sum((i.transportation for i in self.transportation_units), ())
+        return tuple(chain.from_iterable(i.transportation for i in self._transportation_units))
 
     @property
     def total_transportation_impacts(self):
         '''[dict] Total impacts associated with transportation activities.'''
-        return self.get_transportation_impacts(self.transportation_units)
+        return self.get_transportation_impacts(self._transportation_units)
 
     @property
     def lca_streams(self):
-        '''[set] All streams in the linked system with impacts.'''
+        '''[tuple] All streams in the linked system with impacts.'''
         return self._lca_streams
 
     @property
     def stream_inventory(self):
         '''[tuple] All chemical inputs, fugitive gases, waste emissions, and products.'''
-        return tuple(i.stream_impact_item for i in self.lca_streams)
+        return tuple(i.stream_impact_item for i in self._lca_streams)
 
     @property
     def total_stream_impacts(self):
         '''[dict] Total impacts associated with `WasteStreams` (e.g., chemicals, emissions).'''
-        return self.get_stream_impacts(stream_items=self.stream_inventory)
+        return self.get_stream_impacts()
 
     @property
     def other_items (self):